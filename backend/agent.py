@@ -5,15 +5,282 @@ AI Agent that uses OpenAI's Responses API with web_search_preview tool
 to search for real job listings on the internet.
 """
 
-import json
 import logging
+import re
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
-from openai import OpenAI
+
+import ijson
+import orjson
+import tiktoken
+from openai import AsyncOpenAI
+
+from llm import chat, call_with_retry
+from semantic_cache import SemanticCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Tolerant JSON extraction: pull the first fenced JSON object, or failing
+# that any braced span, in a single compiled-regex scan instead of the old
+# multi-pass str.split fence stripping
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})', re.S)
+
+
+def _extract_json(text: str) -> str:
+    """Return the JSON payload embedded in model output text."""
+    match = _JSON_FENCE_RE.search(text)
+    if match:
+        return match.group(1) or match.group(2)
+    return text
+
+
+# Platform-name normalization: one compiled scan + dict lookup instead of
+# a chain of substring tests that each re-lower the string
+_PLATFORM_RE = re.compile(r'(104|1111|cake|linkedin|indeed)', re.I)
+_PLATFORM_MAP = {
+    '104': '104',
+    '1111': '1111',
+    'cake': 'CakeResume',
+    'linkedin': 'LinkedIn',
+    'indeed': 'Other',
+}
+
+# ============================================================================
+# Tokenization
+# ============================================================================
+
+# The encoder loads lazily on first use, not at import: tiktoken fetches
+# its BPE table from the network unless TIKTOKEN_CACHE_DIR is primed, and
+# a cold container without reachability to that CDN must still boot.
+# When loading fails, truncation falls back to a character budget.
+_CHARS_PER_TOKEN = 4  # conservative ASCII average for the fallback
+
+_enc = None
+_enc_failed = False
+_enc_lock = threading.Lock()
+
+
+def _get_encoder():
+    """Return the tiktoken encoding, or None if it can't be loaded."""
+    global _enc, _enc_failed
+    if _enc is None and not _enc_failed:
+        with _enc_lock:
+            if _enc is None and not _enc_failed:
+                try:
+                    try:
+                        _enc = tiktoken.encoding_for_model("gpt-4o-mini")
+                    except KeyError:
+                        _enc = tiktoken.get_encoding("o200k_base")
+                except Exception as e:
+                    logger.warning(
+                        f"tiktoken encoding unavailable, falling back to "
+                        f"character-based truncation: {e}"
+                    )
+                    _enc_failed = True
+    return _enc
+
+# A session typically sends the same resume through 2-3 endpoints; cache
+# the BPE encoding (~50ms on long resumes) keyed by content hash so only
+# the first call pays for it
+_TOKEN_CACHE_MAX = 512
+_token_cache: "OrderedDict[bytes, List[int]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _tokens_for(text: str) -> List[int]:
+    """Return token ids for text, re-encoding only on cache miss."""
+    key = blake2b(text.encode('utf-8'), digest_size=16).digest()
+    with _token_cache_lock:
+        ids = _token_cache.get(key)
+        if ids is not None:
+            _token_cache.move_to_end(key)
+            return ids
+    ids = _get_encoder().encode(text)
+    with _token_cache_lock:
+        _token_cache[key] = ids
+        while len(_token_cache) > _TOKEN_CACHE_MAX:
+            _token_cache.popitem(last=False)
+    return ids
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most max_tokens model tokens.
+
+    Character-based slicing either wastes context budget (ASCII resumes
+    average ~4 chars/token) or blows past it (CJK text can be 1 char/token,
+    common for this app's Taiwan audience); counting real tokens does
+    neither. If the encoder can't load at all, a ~4-chars-per-token slice
+    keeps requests working in degraded mode.
+    """
+    enc = _get_encoder()
+    if enc is None:
+        limit = max_tokens * _CHARS_PER_TOKEN
+        return text if len(text) <= limit else text[:limit]
+    ids = _tokens_for(text)
+    if len(ids) <= max_tokens:
+        return text
+    return enc.decode(ids[:max_tokens])
+
+
+# ============================================================================
+# Prompts
+# ============================================================================
+
+# Static prompt text lives at module scope and is always the first (and
+# longest) block in each message list. Beyond skipping per-call string
+# building, identical prefixes are what OpenAI's automatic prompt caching
+# keys on, so keeping them byte-stable earns the cached-input discount.
+
+_JOB_SYSTEM_PROMPT = """You are a professional job search agent. Your task is to:
+1. Search the web for real, current job openings
+2. Extract accurate job information including title, company, platform, and URL
+3. Return ONLY real jobs with valid URLs that exist right now
+
+CRITICAL: Only return jobs you find through web search. Do NOT make up or hallucinate job listings.
+
+For the platform field, use one of: "104", "1111", "CakeResume", "LinkedIn", "Indeed", "Other"
+
+Return your findings as a JSON object with this exact structure:
+{
+  "jobs": [
+    {
+      "title": "Job Title",
+      "company": "Company Name",
+      "platform": "Platform Name",
+      "link": "https://actual-job-url.com/job/123",
+      "salary": "Salary range or 'Not disclosed'",
+      "location": "City, Country",
+      "tags": ["skill1", "skill2", "skill3"],
+      "description": "Brief 1-2 sentence description"
+    }
+  ],
+  "search_summary": "Brief summary of search performed"
+}"""
+
+_RESUME_SYSTEM_PROMPT = """You are an expert career consultant and resume analyst.
+Analyze resumes thoroughly and extract key information accurately.
+Always respond with valid JSON."""
+
+_RESUME_USER_TEMPLATE = """Analyze this resume and extract the following information:
+1. **Name**: The candidate's full name. If not clearly stated, use "Candidate"
+2. **Summary**: A 2-3 sentence professional summary highlighting their key strengths, experience level, and career focus
+3. **Skills**: 6-10 distinct technical skills, tools, or professional competencies (prioritize hard skills)
+4. **Suggested Roles**: 3 specific job titles that best match this profile
+
+Return ONLY valid JSON with this structure:
+{{
+  "name": "Full Name",
+  "summary": "Professional summary...",
+  "skills": ["skill1", "skill2", ...],
+  "suggestedRoles": ["Role 1", "Role 2", "Role 3"]
+}}
+
+RESUME CONTENT:
+{resume_text}"""
+
+_COVER_LETTER_SYSTEM_PROMPT = "You are an expert cover letter writer. Respond in JSON."
+
+# Streaming variant: json_object mode cannot be streamed token-by-token,
+# so the streamed path asks for plain text instead
+_COVER_LETTER_STREAM_SYSTEM_PROMPT = (
+    "You are an expert cover letter writer. "
+    "Respond with the cover letter text only - no JSON, no markdown fences."
+)
+
+_COVER_LETTER_STREAM_TEMPLATE = """Write a professional, compelling cover letter for this job application.
+
+Guidelines:
+- Professional yet personable tone
+- Highlight relevant experience from the resume
+- Show enthusiasm for the specific role and company
+- Keep it concise (300-400 words)
+- Include a strong opening and call to action
+
+Return only the cover letter text.
+
+JOB DESCRIPTION:
+{job_description}
+
+CANDIDATE'S RESUME:
+{resume_text}"""
+
+_COVER_LETTER_USER_TEMPLATE = """Write a professional, compelling cover letter for this job application.
+
+Guidelines:
+- Professional yet personable tone
+- Highlight relevant experience from the resume
+- Show enthusiasm for the specific role and company
+- Keep it concise (300-400 words)
+- Include a strong opening and call to action
+
+Return JSON with: {{"coverLetter": "Your cover letter text..."}}
+
+JOB DESCRIPTION:
+{job_description}
+
+CANDIDATE'S RESUME:
+{resume_text}"""
+
+_MATCH_SYSTEM_PROMPT = "You are a career coach expert. Respond in JSON."
+
+_MATCH_USER_TEMPLATE = """Analyze how well this resume matches the job description.
+
+Provide:
+1. **Missing Keywords**: Skills/qualifications mentioned in the job but missing from resume
+2. **Match Score**: 0-100 score based on skills, experience, and qualification alignment
+3. **Advice**: Specific suggestions to improve the resume for this role
+
+Return JSON:
+{{
+  "missingKeywords": ["keyword1", "keyword2", ...],
+  "matchScore": 75,
+  "advice": "Specific advice..."
+}}
+
+JOB DESCRIPTION:
+{job_description}
+
+RESUME:
+{resume_text}"""
+
+# ============================================================================
+# Result caching
+# ============================================================================
+
+# Analyses are deterministic enough (low temperature, extraction-style
+# prompts) that re-uploading the same resume should not pay for another
+# model round-trip. Caches are keyed on content hashes and bounded LRU.
+_CACHE_MAX_ENTRIES = 1024
+_cache_lock = threading.Lock()
+_resume_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_match_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _hash_text(text: str) -> str:
+    """Stable 128-bit content hash, usable as a cache key across workers."""
+    return blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _cache_get(cache: "OrderedDict[str, Dict[str, Any]]", key: str) -> Optional[Dict[str, Any]]:
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: "OrderedDict[str, Dict[str, Any]]", key: str, value: Dict[str, Any]) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
 
 @dataclass
 class JobListing:
@@ -40,12 +307,12 @@ class JobSearchAgent:
     listings from across the internet.
     """
     
-    def __init__(self, client: OpenAI, model: str = "gpt-4o-mini"):
+    def __init__(self, client: AsyncOpenAI, model: str = "gpt-4o-mini"):
         """
         Initialize the job search agent.
-        
+
         Args:
-            client: OpenAI client instance
+            client: AsyncOpenAI client instance
             model: Model to use for the agent (default: gpt-4o-mini)
         """
         self.client = client
@@ -77,7 +344,7 @@ class JobSearchAgent:
         Find 6-8 REAL, CURRENTLY OPEN positions.
         """
     
-    def search_jobs(
+    async def search_jobs(
         self,
         roles: List[str],
         skills: List[str],
@@ -97,92 +364,86 @@ class JobSearchAgent:
         logger.info(f"Searching jobs for roles: {roles}, location: {location}")
         
         search_query = self._build_search_query(roles, skills, location)
-        
-        system_prompt = """You are a professional job search agent. Your task is to:
-1. Search the web for real, current job openings
-2. Extract accurate job information including title, company, platform, and URL
-3. Return ONLY real jobs with valid URLs that exist right now
-
-CRITICAL: Only return jobs you find through web search. Do NOT make up or hallucinate job listings.
-
-For the platform field, use one of: "104", "1111", "CakeResume", "LinkedIn", "Indeed", "Other"
-
-Return your findings as a JSON object with this exact structure:
-{
-  "jobs": [
-    {
-      "title": "Job Title",
-      "company": "Company Name",
-      "platform": "Platform Name",
-      "link": "https://actual-job-url.com/job/123",
-      "salary": "Salary range or 'Not disclosed'",
-      "location": "City, Country",
-      "tags": ["skill1", "skill2", "skill3"],
-      "description": "Brief 1-2 sentence description"
-    }
-  ],
-  "search_summary": "Brief summary of search performed"
-}"""
 
+        result_text = ""
         try:
-            # Use the Responses API with web search tool
-            response = self.client.responses.create(
+            # Use the Responses API with web search tool, streaming the
+            # output so jobs are parsed incrementally as they arrive
+            # instead of buffering the full response text first
+            stream = await call_with_retry(
+                self.client.responses.create,
                 model=self.model,
                 tools=[{"type": "web_search_preview"}],
                 input=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": _JOB_SYSTEM_PROMPT},
                     {"role": "user", "content": search_query}
-                ]
+                ],
+                stream=True
             )
-            
-            # Extract the response content
-            result_text = None
-            for output in response.output:
-                if output.type == "message":
-                    for content in output.content:
-                        if content.type == "output_text":
-                            result_text = content.text
-                            break
-            
-            if not result_text:
-                logger.warning("No text response from agent")
-                return []
-            
-            # Parse JSON from response
-            # Handle case where response might have markdown code blocks
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0]
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0]
-            
-            result_json = json.loads(result_text.strip())
-            jobs = result_json.get("jobs", [])
-            
-            # Add IDs to jobs
-            processed_jobs = []
-            for idx, job in enumerate(jobs):
-                job["id"] = f"job-{idx}-{hash(job.get('link', ''))}"
-                # Normalize platform name
-                platform = job.get("platform", "Other")
-                if "104" in platform.lower():
-                    job["platform"] = "104"
-                elif "1111" in platform.lower():
-                    job["platform"] = "1111"
-                elif "cake" in platform.lower():
-                    job["platform"] = "CakeResume"
-                elif "linkedin" in platform.lower():
-                    job["platform"] = "LinkedIn"
-                elif "indeed" in platform.lower():
-                    job["platform"] = "Other"
-                else:
-                    job["platform"] = "Other"
-                    
+
+            processed_jobs: List[Dict[str, Any]] = []
+            completed = ijson.sendable_list()
+            parser = ijson.items_coro(completed, 'jobs.item')
+            raw_parts = []
+            started = False   # seen the opening brace of the JSON object
+            feeding = True    # parser still accepting input
+
+            async for event in stream:
+                if getattr(event, 'type', '') != 'response.output_text.delta':
+                    continue
+                chunk = event.delta or ""
+                raw_parts.append(chunk)
+
+                if not feeding:
+                    continue
+                if not started:
+                    # Skip any markdown fence / prose before the JSON body
+                    brace = chunk.find('{')
+                    if brace < 0:
+                        continue
+                    chunk = chunk[brace:]
+                    started = True
+                try:
+                    parser.send(chunk.encode('utf-8'))
+                except ijson.common.JSONError:
+                    # Trailing fence or prose after the JSON document.
+                    # Catch the base class: the yajl2_c backend raises
+                    # IncompleteJSONError for everything, but the pure-
+                    # Python fallback backend uses sibling subclasses
+                    feeding = False
+
+                # Finalize jobs as soon as the parser completes them
+                while len(processed_jobs) < len(completed):
+                    job = completed[len(processed_jobs)]
+                    self._finalize_job(job, len(processed_jobs))
+                    processed_jobs.append(job)
+
+            if feeding:
+                try:
+                    parser.close()
+                except ijson.common.JSONError:
+                    pass
+            while len(processed_jobs) < len(completed):
+                job = completed[len(processed_jobs)]
+                self._finalize_job(job, len(processed_jobs))
                 processed_jobs.append(job)
-            
+
+            result_text = "".join(raw_parts)
+            if not processed_jobs:
+                if not result_text:
+                    logger.warning("No text response from agent")
+                    return []
+                # Incremental parse found no jobs array - fall back to
+                # extracting and parsing the whole JSON payload
+                result_json = orjson.loads(_extract_json(result_text))
+                for idx, job in enumerate(result_json.get("jobs", [])):
+                    self._finalize_job(job, idx)
+                    processed_jobs.append(job)
+
             logger.info(f"Found {len(processed_jobs)} job listings")
             return processed_jobs
-            
-        except json.JSONDecodeError as e:
+
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse job search response: {e}")
             logger.debug(f"Raw response: {result_text}")
             return []
@@ -190,24 +451,43 @@ Return your findings as a JSON object with this exact structure:
             logger.error(f"Job search failed: {e}")
             raise
 
+    def _finalize_job(self, job: Dict[str, Any], idx: int) -> None:
+        """Assign an id and normalize the platform name in place."""
+        # blake2b is stable across processes and restarts, unlike hash()
+        # which is randomized per interpreter - ids must survive both so
+        # caches keyed on them keep hitting
+        link_digest = blake2b(
+            job.get('link', '').encode('utf-8', 'ignore'), digest_size=8
+        ).hexdigest()
+        job["id"] = f"job-{idx}-{link_digest}"
+        match = _PLATFORM_RE.search(job.get("platform", ""))
+        job["platform"] = _PLATFORM_MAP[match.group(1).lower()] if match else "Other"
+
 
 class ResumeAnalyzer:
     """
     Analyzes resume content using OpenAI to extract candidate profile.
     """
     
-    def __init__(self, client: OpenAI, model: str = "gpt-4o-mini"):
+    def __init__(self, client: AsyncOpenAI, model: str = "gpt-4o-mini"):
         """
         Initialize the resume analyzer.
-        
+
         Args:
-            client: OpenAI client instance
+            client: AsyncOpenAI client instance
             model: Model to use for analysis
         """
         self.client = client
         self.model = model
-    
-    def analyze(self, resume_text: str) -> Dict[str, Any]:
+
+    def _build_messages(self, resume_text: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a single resume analysis."""
+        return [
+            {"role": "system", "content": _RESUME_SYSTEM_PROMPT},
+            {"role": "user", "content": _RESUME_USER_TEMPLATE.format(resume_text=resume_text)}
+        ]
+
+    async def analyze(self, resume_text: str) -> Dict[str, Any]:
         """
         Analyze resume text and extract candidate profile.
         
@@ -219,49 +499,26 @@ class ResumeAnalyzer:
         """
         logger.info("Analyzing resume content...")
         
-        # Truncate if too long (keeping first 6000 chars for context)
-        if len(resume_text) > 6000:
-            resume_text = resume_text[:6000] + "\n[Content truncated...]"
-        
-        system_prompt = """You are an expert career consultant and resume analyst. 
-Analyze resumes thoroughly and extract key information accurately.
-Always respond with valid JSON."""
-
-        user_prompt = f"""Analyze this resume and extract the following information:
-
-RESUME CONTENT:
-{resume_text}
+        # Truncate if too long (keeping first 4000 tokens for context)
+        truncated = truncate_tokens(resume_text, 4000)
+        if len(truncated) < len(resume_text):
+            resume_text = truncated + "\n[Content truncated...]"
 
----
-
-Please extract:
-1. **Name**: The candidate's full name. If not clearly stated, use "Candidate"
-2. **Summary**: A 2-3 sentence professional summary highlighting their key strengths, experience level, and career focus
-3. **Skills**: 6-10 distinct technical skills, tools, or professional competencies (prioritize hard skills)
-4. **Suggested Roles**: 3 specific job titles that best match this profile
-
-Return ONLY valid JSON with this structure:
-{{
-  "name": "Full Name",
-  "summary": "Professional summary...",
-  "skills": ["skill1", "skill2", ...],
-  "suggestedRoles": ["Role 1", "Role 2", "Role 3"]
-}}"""
+        cache_key = _hash_text(resume_text.strip())
+        cached = _cache_get(_resume_cache, cache_key)
+        if cached is not None:
+            logger.info("Resume analysis cache hit - skipping LLM call")
+            return cached
 
         try:
-            response = self.client.chat.completions.create(
+            # Lower temperature for more consistent extraction
+            profile = await chat(
+                self.client,
+                self._build_messages(resume_text),
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.3  # Lower temperature for more consistent extraction
+                temperature=0.3
             )
             
-            result_text = response.choices[0].message.content
-            profile = json.loads(result_text)
-            
             # Validate required fields
             required_fields = ["name", "summary", "skills", "suggestedRoles"]
             for field in required_fields:
@@ -270,101 +527,224 @@ Return ONLY valid JSON with this structure:
                     profile[field] = [] if field in ["skills", "suggestedRoles"] else "Unknown"
             
             logger.info(f"Successfully analyzed resume for: {profile.get('name', 'Unknown')}")
+            _cache_put(_resume_cache, cache_key, profile)
             return profile
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse resume analysis: {e}")
             raise RuntimeError("Failed to analyze resume - invalid response format")
         except Exception as e:
             logger.error(f"Resume analysis failed: {e}")
             raise
 
+    async def analyze_many(self, resume_texts: List[str]) -> str:
+        """
+        Submit a bulk resume analysis via the OpenAI Batch API.
+
+        Batch requests cost 50% of synchronous calls and draw from a
+        separate rate-limit pool, so bulk re-analysis doesn't compete
+        with interactive traffic. Results arrive asynchronously; poll
+        with batch_results().
+
+        Args:
+            resume_texts: Extracted text content of each resume
+
+        Returns:
+            The OpenAI batch id to poll for results
+        """
+        logger.info(f"Submitting batch analysis for {len(resume_texts)} resumes")
+
+        lines = []
+        for i, resume_text in enumerate(resume_texts):
+            truncated = truncate_tokens(resume_text, 4000)
+            if len(truncated) < len(resume_text):
+                resume_text = truncated + "\n[Content truncated...]"
+            lines.append(orjson.dumps({
+                "custom_id": f"r-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(resume_text),
+                    "response_format": {"type": "json_object"},
+                    "temperature": 0.3
+                }
+            }))
+
+        batch_file = await self.client.files.create(
+            file=("resume-batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        logger.info(f"Created batch {batch.id}")
+        return batch.id
+
+    async def batch_results(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Check a batch submitted by analyze_many.
+
+        Args:
+            batch_id: Id returned by analyze_many
+
+        Returns:
+            Dictionary with the batch status; when completed, includes a
+            'profiles' mapping of custom_id to the parsed profile dict.
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        result: Dict[str, Any] = {"id": batch.id, "status": batch.status}
+
+        if batch.status == "completed" and batch.output_file_id:
+            content = await self.client.files.content(batch.output_file_id)
+            profiles = {}
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                body = record.get("response", {}).get("body", {})
+                try:
+                    profiles[record["custom_id"]] = orjson.loads(
+                        body["choices"][0]["message"]["content"]
+                    )
+                except (KeyError, IndexError, orjson.JSONDecodeError) as e:
+                    logger.warning(f"Skipping malformed batch line: {e}")
+            result["profiles"] = profiles
+
+        return result
+
 
 class CoverLetterGenerator:
     """Generates tailored cover letters based on resume and job description."""
     
-    def __init__(self, client: OpenAI, model: str = "gpt-4o-mini"):
+    def __init__(self, client: AsyncOpenAI, model: str = "gpt-4o-mini"):
         self.client = client
         self.model = model
-    
-    def generate(self, resume_text: str, job_description: str) -> str:
+        self._semantic_cache = SemanticCache(client)
+
+    async def generate(self, resume_text: str, job_description: str) -> str:
         """Generate a cover letter for a specific job."""
         logger.info("Generating cover letter...")
-        
-        prompt = f"""Write a professional, compelling cover letter for this job application.
 
-JOB DESCRIPTION:
-{job_description[:2000]}
+        resume_text = truncate_tokens(resume_text, 2000)
+        job_description = truncate_tokens(job_description, 1500)
 
-CANDIDATE'S RESUME:
-{resume_text[:3000]}
+        # Near-duplicate (resume, JD) pairs reuse the previous letter
+        cache_text = resume_text + "\n---\n" + job_description
+        cached, query_vec = await self._semantic_cache.lookup(cache_text)
+        if cached is not None:
+            return cached
 
----
+        prompt = _COVER_LETTER_USER_TEMPLATE.format(
+            job_description=job_description,
+            resume_text=resume_text
+        )
 
-Guidelines:
-- Professional yet personable tone
-- Highlight relevant experience from the resume
-- Show enthusiasm for the specific role and company
-- Keep it concise (300-400 words)
-- Include a strong opening and call to action
+        result = await chat(
+            self.client,
+            [
+                {"role": "system", "content": _COVER_LETTER_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            model=self.model,
+            temperature=0.7
+        )
+        cover_letter = result.get("coverLetter", "")
+        self._semantic_cache.store(query_vec, cover_letter)
+        return cover_letter
+
+    async def generate_stream(self, resume_text: str, job_description: str):
+        """
+        Generate a cover letter, yielding text chunks as they arrive.
+
+        Streaming gets the first tokens to the client in ~300ms instead of
+        blocking for the full multi-second generation. A semantic-cache
+        hit yields the whole cached letter at once.
+        """
+        logger.info("Generating cover letter (streaming)...")
+
+        resume_text = truncate_tokens(resume_text, 2000)
+        job_description = truncate_tokens(job_description, 1500)
 
-Return JSON with: {{"coverLetter": "Your cover letter text..."}}"""
+        cache_text = resume_text + "\n---\n" + job_description
+        cached, query_vec = await self._semantic_cache.lookup(cache_text)
+        if cached is not None:
+            yield cached
+            return
 
-        response = self.client.chat.completions.create(
+        prompt = _COVER_LETTER_STREAM_TEMPLATE.format(
+            job_description=job_description,
+            resume_text=resume_text
+        )
+
+        stream = await call_with_retry(
+            self.client.chat.completions.create,
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are an expert cover letter writer. Respond in JSON."},
+                {"role": "system", "content": _COVER_LETTER_STREAM_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
-            temperature=0.7
+            temperature=0.7,
+            stream=True
         )
-        
-        result = json.loads(response.choices[0].message.content)
-        return result.get("coverLetter", "")
+
+        parts = []
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            if delta:
+                parts.append(delta)
+                yield delta
+
+        self._semantic_cache.store(query_vec, "".join(parts))
 
 
 class JobMatchAnalyzer:
     """Analyzes how well a resume matches a specific job description."""
     
-    def __init__(self, client: OpenAI, model: str = "gpt-4o-mini"):
+    def __init__(self, client: AsyncOpenAI, model: str = "gpt-4o-mini"):
         self.client = client
         self.model = model
-    
-    def analyze_match(self, resume_text: str, job_description: str) -> Dict[str, Any]:
+        self._semantic_cache = SemanticCache(client)
+
+    async def analyze_match(self, resume_text: str, job_description: str) -> Dict[str, Any]:
         """Analyze resume-job compatibility."""
         logger.info("Analyzing job match...")
-        
-        prompt = f"""Analyze how well this resume matches the job description.
-
-JOB DESCRIPTION:
-{job_description[:2000]}
 
-RESUME:
-{resume_text[:3000]}
-
----
-
-Provide:
-1. **Missing Keywords**: Skills/qualifications mentioned in the job but missing from resume
-2. **Match Score**: 0-100 score based on skills, experience, and qualification alignment
-3. **Advice**: Specific suggestions to improve the resume for this role
-
-Return JSON:
-{{
-  "missingKeywords": ["keyword1", "keyword2", ...],
-  "matchScore": 75,
-  "advice": "Specific advice..."
-}}"""
+        resume_text = truncate_tokens(resume_text, 2000)
+        job_description = truncate_tokens(job_description, 1500)
+
+        # Keyed on the (resume, job description) pair
+        cache_key = _hash_text(resume_text) + ':' + _hash_text(job_description)
+        cached = _cache_get(_match_cache, cache_key)
+        if cached is not None:
+            logger.info("Job match cache hit - skipping LLM call")
+            return cached
+
+        # Exact miss - check for a paraphrased near-duplicate of the pair
+        cache_text = resume_text + "\n---\n" + job_description
+        cached, query_vec = await self._semantic_cache.lookup(cache_text)
+        if cached is not None:
+            return cached
+
+        prompt = _MATCH_USER_TEMPLATE.format(
+            job_description=job_description,
+            resume_text=resume_text
+        )
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a career coach expert. Respond in JSON."},
+        result = await chat(
+            self.client,
+            [
+                {"role": "system", "content": _MATCH_SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"},
+            model=self.model,
             temperature=0.3
         )
-        
-        return json.loads(response.choices[0].message.content)
+        _cache_put(_match_cache, cache_key, result)
+        self._semantic_cache.store(query_vec, result)
+        return result
@@ -8,14 +8,21 @@ Flask application providing AI-powered career consulting services:
 - Cover letter generation
 """
 
+import asyncio
+import functools
 import os
 import logging
-from flask import Flask, request, jsonify
+import threading
+
+import httpx
+import orjson
+from flask import Flask, Response, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-from resume_parser import parse_resume
+from resume_parser import parse_resume, get_parse_pool
 from agent import (
     JobSearchAgent,
     ResumeAnalyzer,
@@ -33,8 +40,19 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (2-5x faster than stdlib json)."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Initialize OpenAI Client
@@ -43,16 +61,132 @@ if not openai_api_key:
     logger.error("OPENAI_API_KEY environment variable is not set!")
     raise RuntimeError("OPENAI_API_KEY is required. Please set it in your .env file.")
 
-client = OpenAI(api_key=openai_api_key)
+# All async I/O runs on one long-lived background event loop. Flask's
+# async views would otherwise get a fresh loop per request (asgiref's
+# async_to_sync), which breaks the shared httpx pool below: pooled
+# keep-alive connections bind to the loop that created them, and reusing
+# one from a later request's loop raises dead-transport errors. One
+# persistent loop keeps the pool valid for the process lifetime, so
+# routes stay sync and submit coroutines here instead.
+#
+# The loop thread starts lazily per process rather than at import:
+# threads don't survive fork, so under a preloading server (gunicorn
+# --preload) a loop started in the master would leave every worker
+# submitting to a loop nobody runs - deadlocking all routes.
+_loop = None
+_loop_pid = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared loop, (re)starting its thread in this process."""
+    global _loop, _loop_pid
+    if _loop is None or _loop_pid != os.getpid():
+        with _loop_lock:
+            if _loop is None or _loop_pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="openai-loop", daemon=True
+                ).start()
+                _loop = loop
+                _loop_pid = os.getpid()
+    return _loop
+
+
+def run_async(coro):
+    """Run a coroutine on the shared background loop and return its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def _gather(coros, return_exceptions=False):
+    """asyncio.gather wrapper so routes can fan out via run_async."""
+    return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+
+# Async client so agent calls can overlap (asyncio.gather on the shared
+# loop) instead of blocking a worker thread per request. The SDK's
+# default httpx pool degrades under high concurrency, so hand it an
+# explicitly sized transport instead of the per-client default.
+# Keep-alive is held for 90s (matching api.openai.com) so bursty traffic
+# reuses warm TLS connections, and HTTP/2 multiplexes concurrent in-flight
+# requests over few connections. All four agents share this one pool;
+# every call runs on the loop above, so pooled connections always belong
+# to a live loop.
+http_client = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_keepalive_connections=32,
+        max_connections=64,
+        keepalive_expiry=90
+    ),
+    http2=True,
+    timeout=httpx.Timeout(60.0, connect=5.0)
+)
+client = AsyncOpenAI(api_key=openai_api_key, http_client=http_client)
 
 # Configuration
 MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
-# Initialize AI agents
-resume_analyzer = ResumeAnalyzer(client, model=MODEL)
-job_search_agent = JobSearchAgent(client, model=MODEL)
-cover_letter_generator = CoverLetterGenerator(client, model=MODEL)
-job_match_analyzer = JobMatchAnalyzer(client, model=MODEL)
+# Resume parsing is CPU-bound (PDF/DOCX extraction); run it in
+# resume_parser's shared process pool so concurrent requests scale
+# across cores instead of serializing on the GIL, while the event loop
+# stays free for OpenAI I/O. Sharing that pool (rather than owning a
+# second one) keeps its worker/page-thread budget in force here too.
+
+
+async def parse_resume_async(source, filename, mime_type):
+    """
+    Run parse_resume in the process pool without blocking the event loop.
+
+    Accepts raw bytes or an upload stream. Streams are drained to bytes
+    only here, at the process boundary - pool arguments must pickle -
+    so route code never buffers uploads itself.
+    """
+    if hasattr(source, 'read'):
+        source = source.read()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_parse_pool(), parse_resume, source, filename, mime_type
+    )
+
+
+def iter_over_async(agen):
+    """
+    Drive an async generator from a sync streaming route.
+
+    Flask streams responses from plain generators, so async generators
+    (like CoverLetterGenerator.generate_stream) are pumped one item at a
+    time on the shared background loop.
+    """
+    loop = _get_loop()
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+        except StopAsyncIteration:
+            break
+
+# AI agents are built lazily on first use: under gunicorn --preload each
+# forked worker shares the parent's copy-on-write pages instead of paying
+# the construction (and prompt-string) overhead N times at import
+
+
+@functools.cache
+def get_resume_analyzer() -> ResumeAnalyzer:
+    return ResumeAnalyzer(client, model=MODEL)
+
+
+@functools.cache
+def get_job_search_agent() -> JobSearchAgent:
+    return JobSearchAgent(client, model=MODEL)
+
+
+@functools.cache
+def get_cover_letter_generator() -> CoverLetterGenerator:
+    return CoverLetterGenerator(client, model=MODEL)
+
+
+@functools.cache
+def get_job_match_analyzer() -> JobMatchAnalyzer:
+    return JobMatchAnalyzer(client, model=MODEL)
 
 
 # ============================================================================
@@ -86,24 +220,22 @@ def analyze_resume():
         return jsonify({"error": "No file selected"}), 400
     
     try:
-        # Read file content
-        file_content = file.read()
         filename = file.filename
         mime_type = file.content_type
-        
+
         logger.info(f"Processing resume: {filename} ({mime_type})")
-        
-        # Parse resume to extract text
-        resume_text = parse_resume(file_content, filename, mime_type)
-        
+
+        # Parse resume to extract text (stream, not a buffered read)
+        resume_text = run_async(parse_resume_async(file.stream, filename, mime_type))
+
         if not resume_text or len(resume_text.strip()) < 50:
             return jsonify({
                 "error": "Could not extract meaningful content from the file. Please ensure it's a valid resume."
             }), 400
         
         # Analyze with AI
-        profile = resume_analyzer.analyze(resume_text)
-        
+        profile = run_async(get_resume_analyzer().analyze(resume_text))
+
         logger.info(f"Successfully analyzed resume for: {profile.get('name', 'Unknown')}")
         return jsonify(profile)
         
@@ -118,6 +250,115 @@ def analyze_resume():
         return jsonify({"error": "Failed to analyze resume. Please try again."}), 500
 
 
+@app.route('/api/full-analysis', methods=['POST'])
+def full_analysis():
+    """
+    Run the whole pipeline in one request: extract the candidate profile,
+    search jobs for it, then score the resume against every job found.
+
+    The per-job match analyses are independent, so they run concurrently
+    with asyncio.gather - total wall time is roughly profile + search +
+    one match round instead of the sum of every call.
+
+    Expects: multipart/form-data with 'file' field, optional 'location'
+    Returns: JSON with profile, jobs, and matches keyed by job id
+    """
+    if 'file' not in request.files:
+        return jsonify({"error": "No file uploaded"}), 400
+
+    file = request.files['file']
+    if file.filename == '':
+        return jsonify({"error": "No file selected"}), 400
+
+    location = request.form.get('location', 'Taiwan')
+
+    try:
+        resume_text = run_async(parse_resume_async(file.stream, file.filename, file.content_type))
+
+        if not resume_text or len(resume_text.strip()) < 50:
+            return jsonify({
+                "error": "Could not extract meaningful content from the file. Please ensure it's a valid resume."
+            }), 400
+
+        profile = run_async(get_resume_analyzer().analyze(resume_text))
+        jobs = run_async(get_job_search_agent().search_jobs(
+            profile.get('suggestedRoles', []),
+            profile.get('skills', []),
+            location
+        ))
+
+        # Score all found jobs against the resume concurrently
+        match_results = run_async(_gather([
+            get_job_match_analyzer().analyze_match(
+                resume_text, job.get('description') or job.get('title', '')
+            )
+            for job in jobs
+        ], return_exceptions=True))
+
+        matches = {}
+        for job, match in zip(jobs, match_results):
+            if isinstance(match, Exception):
+                logger.warning(f"Match scoring failed for {job.get('id')}: {match}")
+                continue
+            matches[job["id"]] = match
+
+        return jsonify({"profile": profile, "jobs": jobs, "matches": matches})
+
+    except ValueError as e:
+        logger.warning(f"Invalid file format: {e}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Full analysis error: {e}", exc_info=True)
+        return jsonify({"error": "Failed to run full analysis. Please try again."}), 500
+
+
+@app.route('/api/analyze-resumes-batch', methods=['POST'])
+def analyze_resumes_batch():
+    """
+    Submit multiple resumes for bulk analysis via the OpenAI Batch API.
+
+    Expects: multipart/form-data with one or more 'files' fields
+    Returns: JSON with batchId to poll via /api/batch-status/<id>
+    """
+    files = request.files.getlist('files')
+    if not files:
+        return jsonify({"error": "No files uploaded"}), 400
+
+    try:
+        # Parse all uploads concurrently across pool workers
+        resume_texts = run_async(_gather([
+            parse_resume_async(file.stream, file.filename, file.content_type)
+            for file in files
+        ]))
+
+        batch_id = run_async(get_resume_analyzer().analyze_many(resume_texts))
+
+        logger.info(f"Submitted batch {batch_id} for {len(resume_texts)} resumes")
+        return jsonify({"batchId": batch_id, "count": len(resume_texts)})
+
+    except ValueError as e:
+        logger.warning(f"Invalid file in batch: {e}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Batch submission error: {e}", exc_info=True)
+        return jsonify({"error": "Failed to submit batch. Please try again."}), 500
+
+
+@app.route('/api/batch-status/<batch_id>', methods=['GET'])
+def batch_status(batch_id):
+    """
+    Poll a resume-analysis batch.
+
+    Returns: JSON with batch status; includes 'profiles' once completed
+    """
+    try:
+        result = run_async(get_resume_analyzer().batch_results(batch_id))
+        return jsonify(result)
+    except Exception as e:
+        logger.error(f"Batch status error: {e}", exc_info=True)
+        return jsonify({"error": "Failed to retrieve batch status."}), 500
+
+
 @app.route('/api/search-jobs', methods=['POST'])
 def search_jobs():
     """
@@ -141,7 +382,7 @@ def search_jobs():
         logger.info(f"Searching jobs - Roles: {roles}, Location: {location}")
         
         # Use AI agent with web search
-        jobs = job_search_agent.search_jobs(roles, skills, location)
+        jobs = run_async(get_job_search_agent().search_jobs(roles, skills, location))
         
         logger.info(f"Found {len(jobs)} matching jobs")
         return jsonify(jobs)
@@ -170,15 +411,14 @@ def analyze_job_match():
     file = request.files['file']
     
     try:
-        file_content = file.read()
         filename = file.filename
         mime_type = file.content_type
-        
+
         # Parse resume
-        resume_text = parse_resume(file_content, filename, mime_type)
-        
+        resume_text = run_async(parse_resume_async(file.stream, filename, mime_type))
+
         # Analyze match
-        result = job_match_analyzer.analyze_match(resume_text, job_description)
+        result = run_async(get_job_match_analyzer().analyze_match(resume_text, job_description))
         
         return jsonify(result)
         
@@ -190,33 +430,40 @@ def analyze_job_match():
 @app.route('/api/generate-cover-letter', methods=['POST'])
 def generate_cover_letter():
     """
-    Generate tailored cover letter.
-    
+    Generate tailored cover letter, streamed as it is written.
+
     Expects: multipart/form-data with 'file' and 'jobDescription' fields
-    Returns: JSON with coverLetter field
+    Returns: text/event-stream of SSE events with a 'delta' text field,
+             terminated by a [DONE] event
     """
     if 'file' not in request.files:
         return jsonify({"error": "No file uploaded"}), 400
-    
+
     job_description = request.form.get('jobDescription', '')
     if not job_description.strip():
         return jsonify({"error": "Job description is required"}), 400
-    
+
     file = request.files['file']
-    
+
     try:
-        file_content = file.read()
         filename = file.filename
         mime_type = file.content_type
-        
-        # Parse resume
-        resume_text = parse_resume(file_content, filename, mime_type)
-        
-        # Generate cover letter
-        cover_letter = cover_letter_generator.generate(resume_text, job_description)
-        
-        return jsonify({"coverLetter": cover_letter})
-        
+
+        # Parse resume (still in the pool; this sync route just blocks
+        # its own worker thread, not an event loop). Pool arguments must
+        # pickle, so the stream is drained right at the boundary.
+        resume_text = get_parse_pool().submit(
+            parse_resume, file.stream.read(), filename, mime_type
+        ).result()
+
+        def event_stream():
+            stream = get_cover_letter_generator().generate_stream(resume_text, job_description)
+            for delta in iter_over_async(stream):
+                yield "data: " + orjson.dumps({"delta": delta}).decode('utf-8') + "\n\n"
+            yield "data: [DONE]\n\n"
+
+        return Response(stream_with_context(event_stream()), mimetype='text/event-stream')
+
     except Exception as e:
         logger.error(f"Cover letter generation error: {e}", exc_info=True)
         return jsonify({"error": str(e)}), 500
@@ -0,0 +1,98 @@
+"""
+LLM Call Helper Module
+----------------------
+Single entry point for OpenAI chat-completion calls. Cross-cutting
+concerns - retry with backoff, the shared concurrency cap, and response
+parsing - live here once instead of being re-implemented per agent, so
+global changes (metrics, caching policy, message shaping) apply to every
+endpoint uniformly.
+"""
+
+import asyncio
+import logging
+import os
+import weakref
+from typing import Any, Dict, List, Union
+
+import orjson
+from openai import APIConnectionError, APITimeoutError, RateLimitError
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Cap on simultaneously in-flight OpenAI calls; a burst queues here instead
+# of tripping 429s at the API and failing user requests
+_MAX_CONCURRENT_CALLS = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+
+# asyncio primitives bind to a running loop, and Flask may give each
+# request its own loop - keep one semaphore per loop
+_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _request_slot() -> asyncio.Semaphore:
+    """Return the concurrency semaphore for the current event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _semaphores.get(loop)
+    if sem is None:
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_CALLS)
+        _semaphores[loop] = sem
+    return sem
+
+
+@retry(
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+async def call_with_retry(create, **kwargs):
+    """
+    Issue one OpenAI SDK call under the shared concurrency cap.
+
+    Transient failures (429s, dropped connections, timeouts) are retried
+    with jittered exponential backoff; anything else propagates so the
+    caller's error handling still applies.
+    """
+    async with _request_slot():
+        return await create(**kwargs)
+
+
+async def chat(
+    client,
+    messages: List[Dict[str, str]],
+    *,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+    json_mode: bool = True
+) -> Union[Dict[str, Any], str]:
+    """
+    Run one chat completion and return its parsed payload.
+
+    Args:
+        client: AsyncOpenAI client instance
+        messages: Chat messages, static prefix first (prompt-cache friendly)
+        model: Model to use for the call
+        temperature: Sampling temperature
+        json_mode: When True (default), request json_object output and
+            return the orjson-parsed dict; otherwise return the raw text
+
+    Returns:
+        Parsed response dict, or the content string when json_mode=False
+    """
+    kwargs: Dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+    }
+    if json_mode:
+        kwargs["response_format"] = {"type": "json_object"}
+
+    response = await call_with_retry(client.chat.completions.create, **kwargs)
+    content = response.choices[0].message.content
+    return orjson.loads(content) if json_mode else content
@@ -0,0 +1,104 @@
+"""
+Semantic Cache Module
+---------------------
+Embedding-based near-duplicate cache for LLM results. Users frequently
+paste paraphrased versions of the same job posting; an exact-hash cache
+misses those, but their embeddings land close together. Entries whose
+cosine similarity to the query exceeds a threshold are treated as hits.
+"""
+
+import logging
+import threading
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from openai import AsyncOpenAI
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIM = 1536
+
+
+class SemanticCache:
+    """
+    In-process nearest-neighbour cache over OpenAI embeddings.
+
+    Vectors are kept L2-normalized in a single (N, 1536) float32 matrix so
+    a lookup is one matrix-vector product; payloads live in a parallel
+    list kept in lockstep under a lock. Oldest entries are evicted once
+    max_entries is reached.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        threshold: float = 0.92,
+        max_entries: int = 512
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            client: AsyncOpenAI client used for embedding calls
+            threshold: Minimum cosine similarity counted as a hit
+            max_entries: Maximum number of cached entries before eviction
+        """
+        self.client = client
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.vecs = np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+        self.payloads: List[Any] = []
+        # vecs and payloads index each other, so reads and mutations must
+        # not interleave - an uneven pair maps argmax to the wrong payload
+        self._lock = threading.Lock()
+
+    async def _embed(self, text: str) -> np.ndarray:
+        """Embed text and return a unit-length float32 vector."""
+        response = await self.client.embeddings.create(
+            model=EMBEDDING_MODEL,
+            input=text[:8000]
+        )
+        vec = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec /= norm
+        return vec
+
+    async def lookup(self, text: str) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+        """
+        Look up a near-duplicate entry for the given text.
+
+        Returns:
+            (payload, query_vector) - payload is None on a miss. The query
+            vector is returned so a subsequent store() doesn't re-embed.
+            Both are None if the embedding call itself failed.
+        """
+        try:
+            vec = await self._embed(text)
+        except Exception as e:
+            # The cache is an optimization - never let it break the request
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None, None
+
+        with self._lock:
+            if self.payloads:
+                sims = self.vecs @ vec
+                best = int(np.argmax(sims))
+                if sims[best] >= self.threshold:
+                    logger.info(f"Semantic cache hit (similarity={sims[best]:.3f})")
+                    return self.payloads[best], vec
+
+        return None, vec
+
+    def store(self, vec: Optional[np.ndarray], payload: Any) -> None:
+        """Store a payload under a previously computed query vector."""
+        if vec is None:
+            return
+        with self._lock:
+            if len(self.payloads) >= self.max_entries:
+                self.vecs = self.vecs[1:]
+                self.payloads.pop(0)
+            self.vecs = np.vstack([self.vecs, vec[np.newaxis, :]])
+            self.payloads.append(payload)
@@ -116,10 +116,37 @@ export const generateCoverLetter = async (resumeData: FileData, jobContext: stri
         body: formData,
     });
 
-    if (!response.ok) {
+    if (!response.ok || !response.body) {
         return "Could not generate cover letter.";
     }
 
-    const result = await response.json();
-    return result.coverLetter;
+    // The endpoint streams SSE events, each carrying a { delta } payload,
+    // terminated by a [DONE] event. Accumulate deltas into the letter.
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let letter = '';
+
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const events = buffer.split('\n\n');
+        buffer = events.pop() || '';
+        for (const event of events) {
+            if (!event.startsWith('data: ')) continue;
+            const payload = event.slice(6);
+            if (payload === '[DONE]') {
+                return letter;
+            }
+            try {
+                letter += JSON.parse(payload).delta || '';
+            } catch (error) {
+                console.error("Cover Letter stream parse error:", error);
+            }
+        }
+    }
+
+    return letter;
 };